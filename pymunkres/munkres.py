@@ -1,17 +1,44 @@
 """Munkres Algorithm implementation (Hungarian Algorithm)"""
 
 from typing import Sequence, Callable, Any, Tuple, List, Dict, Set
+from itertools import permutations
+from math import fabs
 
-# NOTE If using numpy this should not be needed
-from math import isnan
+import numpy as np
 
-__EPS = 1e-9  # Floating point tolerance
+try:
+    from numba import njit, config as numba_config
+except ImportError:
+    njit = None
+
+__EPS = 1e-9  # Floating point tolerance (integer costs are compared exactly)
+
+# Numba can be installed but disabled (NUMBA_DISABLE_JIT=1)
+__COMPILED = njit is not None and not numba_config.DISABLE_JIT
+
+
+def __jit(func: Callable) -> Callable:
+    # Compile the solver kernels with Numba when it's available,
+    # otherwise they will run as plain Python on NumPy arrays
+    return func if njit is None else njit(cache=True)(func)
+
+
+def __kernel(fallback: Callable) -> Callable[[Callable], Callable]:
+    # Hot loops are written as scalar loops, which only pay off once compiled:
+    # without Numba they would run as Python bytecode,
+    # so the vectorized fallback (whole-array NumPy operations) runs instead
+    def decorate(func: Callable) -> Callable:
+        return njit(cache=True)(func) if __COMPILED else fallback
+
+    return decorate
 
 
 def make_cost_matrix(
     workers: Sequence,
     jobs: Sequence,
     cost_function: Callable[[Any, Any, int, int], float],
+    memoize: bool = False,
+    vectorized: bool = False,
 ) -> List[List[float]]:
     """
     Utility function to create a cost matrix by calculating the cost of pairing every
@@ -25,6 +52,8 @@ def make_cost_matrix(
     - `jobs` (***Sequence[Any]***) Sequence of jobs (defines the matrix columns).
     - `cost_function` (***Callable[[Any, Any, int, int], float]***) The function
       used to calculate the cost for a specific worker-job pairing.
+    - `memoize` (***bool***) Cache the cost of each distinct (worker, job) pair of values (defaults to `False`).
+    - `vectorized` (***bool***) Compute every cost with a single call on NumPy arrays (defaults to `False`).
 
     ##### Cost function signature
     `cost_function` will accept 4 positional arguments in this order:
@@ -35,8 +64,33 @@ def make_cost_matrix(
     - `index_j`: The index `j` of the job value in the `jobs` Sequence (column index).
 
     And it will return a floating point value (or an integer) that will represent the cost of assigning worker a to job b.
+
+    ##### Memoization
+
+    When workers or jobs contain repeated values (e.g. categorical data), set `memoize` to `True`
+    in order to call `cost_function` only once for each distinct pair of values.
+    This requires hashable values, and a cost function that does not depend on the indexes `i` and `j`.
+
+    ##### Vectorization
+
+    When `cost_function` is a closed-form NumPy expression (e.g. `lambda a,b,i,j: abs(a-b)`),
+    set `vectorized` to `True` in order to call it only once, with broadcastable arrays:
+    workers as a column (N x 1), jobs as a row (1 x M), and the row and column indexes (N x M).
+    The function must return an (N x M) array, or anything that broadcasts to it.
+    `memoize` has no effect on vectorized cost functions.
     """
 
+    if vectorized:
+        N, M = len(workers), len(jobs)
+        index_i, index_j = np.indices((N, M))
+        costs = cost_function(
+            np.asarray(workers)[:, None], np.asarray(jobs)[None, :], index_i, index_j
+        )
+        return np.broadcast_to(costs, (N, M)).tolist()
+
+    if memoize:
+        cost_function = __memoized(cost_function)
+
     cost_matrix = []
     for i, a in enumerate(workers):
         row = []
@@ -46,11 +100,28 @@ def make_cost_matrix(
     return cost_matrix
 
 
+def __memoized(
+    cost_function: Callable[[Any, Any, int, int], float],
+) -> Callable[[Any, Any, int, int], float]:
+    # Cache the cost of each distinct (worker, job) pair of values
+    cache = {}
+
+    def cached_cost_function(a: Any, b: Any, i: int, j: int) -> float:
+        key = (a, b)
+        if key not in cache:
+            cache[key] = cost_function(a, b, i, j)
+        return cache[key]
+
+    return cached_cost_function
+
+
 def munkres(
     cost_matrix: List[List[float]],
     maximization: bool = False,
     pad_cost: float = 0,
     disallowment_map: Dict[int, Set[int]] = {},
+    python_fallback: bool = True,
+    method: str = "jv",
 ) -> Tuple[List[int], List[int], bool]:
     """
     Computes the minimum cost bipartite matching on a rectangular (N x M) cost matrix.
@@ -59,11 +130,12 @@ def munkres(
 
     ##### Cost matrix
 
-    - The cost matrix is a 2-D list (N x M) where cost[i][j] is the numeric cost of assigning row i to column j.
+    - The cost matrix is a 2-D list (N x M) where cost[i][j] is the numeric cost of assigning row i to column j,
+    any 2-D array-like (e.g. a NumPy array) is also accepted.
     - Rows typically represent "agents" (e.g., workers), columns represent "tasks" (e.g., jobs);
     the algorithm computes the assignment that minimizes (or maximizes) the total cost or profit.
     - Entries can be integers or floats. When there are fewer jobs than workers, or vice versa,
-    the resulting rectangular cost matrix is ​​filled with predefined costs, which in most cases can be 0, but can also be a specific value that best fits the problem.
+    the rectangular cost matrix is solved as is, and the exceeding workers (or jobs) are left unassigned.
 
     ##### Maximization flag
 
@@ -71,8 +143,9 @@ def munkres(
 
     ##### Padding cost
 
-    `pad_cost` is an optional floating point value (defaults to 0) that will be used as the default cost for padded assignments.
-    You can usually leave this to default for most of the problems, but you can also choose a specific value that best fits your problem.
+    `pad_cost` is kept for backwards compatibility and has no effect.
+    Rectangular cost matrices are no longer padded, and since every padded assignment had the same cost,
+    the padding cost never affected the solution.
 
     ##### Disallowment Map
 
@@ -82,6 +155,27 @@ def munkres(
 
     Each of these assignments will always have an infinite cost, and if the optimal solution still includes any of these assignments, they will be set to unassigned in post-processing.
 
+    ##### Python fallback
+
+    The solver is compiled with [Numba](https://numba.pydata.org/) when it's installed.
+    If Numba is not available, the solver runs as plain Python when `python_fallback` is `True` (default),
+    otherwise an `ImportError` is raised.
+
+    ##### Method
+
+    - `"jv"` (default): Jonker-Volgenant shortest augmenting paths (Dijkstra over the reduced costs).
+    Square matrices start from column reduction and augmenting row reduction,
+    rectangular ones from a greedy assignment of each row to its cheapest column.
+    - `"hungarian"`: The original Hungarian method, growing alternating trees of tight edges.
+
+    Both methods are O(n^3). On cost matrices with only finite costs they reach the same optimal cost,
+    although ties may be broken differently.
+    Shortest paths need finite potentials, so infinite costs (including disallowed assignments)
+    are always solved with the `"hungarian"` method, and both methods return the same solution:
+
+    - `-inf` costs: as many of them as possible are assigned, then the sum of the finite costs is minimized.
+    - `+inf` costs: they are only assigned to rows that have no finite cost left.
+
     #### Return values
 
     - `assignments` (***List[int]***): `assignments[i] = j` if the worker at row `i` is assigned to the job at column `j`, or `-1` if **unassigned** or assigned to a nonexistent job/column.
@@ -89,6 +183,11 @@ def munkres(
     - `is_optimal` (***bool***): Indicates whether the algorithm's potentials certify optimality.
     """
 
+    if njit is None and not python_fallback:
+        raise ImportError("Numba is required when python_fallback is disabled")
+
+    assert method in ("jv", "hungarian"), f"Unknown method: {method}"
+
     # In order to solve the maximization problem by solving the minimization problem, all costs get negated
     SIGN = -1 if maximization else 1
 
@@ -101,325 +200,1053 @@ def munkres(
 
     assert M > 0, "Cost matrix has no columns (jobs)"
 
-    # Base 1->1 case
-    if N == 1 and M == 1:
-        return [0], [0], True
+    # Every row of the solver gets assigned, so there can't be more rows than columns.
+    # With more workers than jobs the problem is solved on the transposed matrix.
+    transposed = N > M
 
-    # Get padding dimensions
-    PAD_N = max(N, M)
-    PAD_M = PAD_N
+    # Build the cost matrix once, so that the disallowment and sign checks
+    # do not need to be repeated for every cell access
+    C, disallowed, integral = __build_cost_matrix(
+        cost_matrix, N, M, SIGN, disallowment_map, transposed
+    )
 
-    # Calculate potentials U (minimum for each row)
-    u = []
-    for i in range(PAD_N):
-        if i >= N:
-            # Padding zone
-            u.append(pad_cost)
-            continue
+    # Reduced costs of integer matrices are exact, and can be compared to 0 without tolerance
+    eps = 0.0 if integral else __EPS
 
-        row_min = min(
-            (
-                # Disallowment check
-                float("inf")
-                if i in disallowment_map and j in disallowment_map[i]
-                # Padding check
-                else (SIGN * cost_matrix[i][j] if j < M else pad_cost)
-            )
-            for j in range(PAD_M)
-        )
-        if isnan(row_min):
-            # NaN values are converted to 0
-            row_min = 0
-        u.append(row_min)
-
-    # Calculate potentials V
-    # (minimum for each column - u[i])
-    v = []
-    for j in range(PAD_M):
-        col_min = float("inf")
-        for i in range(PAD_N):
-            cost = (
-                # Disallowment check
-                float("inf")
-                if i in disallowment_map and j in disallowment_map[i]
-                # Padding check
-                else (SIGN * cost_matrix[i][j] if i < N and j < M else pad_cost)
-            ) - u[i]
-            if isnan(cost):
-                cost = 0
-            col_min = min(col_min, cost)
-        v.append(col_min)
-
-    # Initialize (padded) assignments (Z[i] -> j)
-    Z = [-1] * PAD_N
-
-    # Initialize (padded) inversion vector (inversions[j] -> i)
-    inversions = [-1] * PAD_M
-
-    # Iterate over unassigned (padded) rows
-    for i in range(PAD_N):
-
-        # Run augmented path search for this row
-        path_found = False
-        while not path_found:
-
-            # Initialize alternated path
-            S = set((i,))
-            T = set()
-
-            # Walk through the alternated path to find an augmented path
-            path, path_found = __search_augmented_path(
-                i,
-                cost_matrix,
-                N,
-                M,
-                PAD_M,
-                pad_cost,
-                inversions,
-                u,
-                v,
-                S,
-                T,
-                SIGN,
-                disallowment_map,
-            )
-            if not path_found:
-                # Calculate delta
-                # (minimum reduced cost considering all visited rows,
-                #  and all unvisited columns in the alternated path)
-                delta = min(
-                    [
-                        __reduced_cost(
-                            cost_matrix,
-                            u,
-                            v,
-                            row,
-                            col,
-                            N,
-                            M,
-                            pad_cost,
-                            SIGN,
-                            disallowment_map,
-                        )
-                        for row in S  # All visited rows
-                        for col in range(PAD_M)
-                        if col not in T  # All unvisited columns
-                    ]
-                    or [0]
-                )
-
-                if abs(delta) < __EPS:
-                    # In theory this should not happen, floating-point rounding or pathological matrices could trigger this.
-                    # if it happens return assigments with path_found = False
-                    break
-
-                # Update potentials
-                for row_i, u_i in enumerate(u):
-                    # Add delta to the potentials of all visited rows in the alternated path
-                    new_u = u_i + delta if row_i in S else u_i
-                    if isnan(new_u):
-                        new_u = 0
-                    u[row_i] = new_u
-
-                for col_j, v_j in enumerate(v):
-                    # Subtract delta from the potentials of all visited columns in the alternated path
-                    new_v = v_j - delta if col_j in T else v_j
-                    if isnan(new_v):
-                        new_v = 0
-                    v[col_j] = new_v
-                continue
+    # Base cases (up to 3x3) are solved in closed form, as long as every assignment is allowed.
+    # Enumerating every permutation is cheaper than setting up the solver for tiny matrices,
+    # which are common when munkres is called in inner loops.
+    if N == M <= 3 and np.isfinite(C).all():
+        return __solve_small(C)
 
-            # Walk through augmented path and invert each arc to assign this row
-            for arc in path:
-                row_i, col_j = arc
+    with np.errstate(invalid="ignore"):
+        # Sparse matrices (mostly disallowed or infinite costs) often split into independent blocks,
+        # each of them is solved on its own smaller cost matrix
+        components = __connected_components(C) if np.isposinf(C).any() else []
+        if len(components) > 1:
+            Z, inversions, u, v = __solve_components(C, components, method, eps)
+        else:
+            Z, inversions, u, v = __solve_dense(C, method, eps)
 
-                # Check if this arc represents an assignment
-                if Z[row_i] == col_j:
-                    # Invert the assignment
-                    Z[row_i] = -1
-                    inversions[col_j] = -1
-                else:
-                    # Perform assignment
-                    Z[row_i] = col_j
-                    inversions[col_j] = row_i
+    # Map the solution back to the rows and columns of the input
+    if transposed:
+        Z, inversions = inversions, Z
+
+    # Filter any disallowed assignment from the optimal solution
+    rows = np.flatnonzero(Z != -1)
+    Z[rows[disallowed[rows, Z[rows]]]] = -1
+
+    cols = np.flatnonzero(inversions != -1)
+    inversions[cols[disallowed[inversions[cols], cols]]] = -1
 
     # Returns assignments, inversions, and a flag indicating whether the solution is optimal.
-    # Padded assignments and inversions will be reduced to the actual size of the input.
-    # Optimality checking considers padded assignments.
-    return (
-        [
-            # Filter any disallowed assignment from the optimal solution
-            -1 if j >= M or i in disallowment_map and j in disallowment_map[i] else j
-            for i, j in enumerate(Z[:N])
-        ],
-        [
-            # Filter any disallowed assignment from the optimal solution
-            -1 if i >= N or i in disallowment_map and j in disallowment_map[i] else i
-            for j, i in enumerate(inversions[:M])
-        ],
-        __optimality_check(
-            cost_matrix, Z, u, v, N, M, pad_cost, SIGN, disallowment_map
-        ),
-    )
+    with np.errstate(invalid="ignore"):
+        is_optimal = bool(
+            __optimality_check(C, inversions if transposed else Z, u, v, eps)
+        )
 
+    return Z.tolist(), inversions.tolist(), is_optimal
 
-def __optimality_check(
+
+def __build_cost_matrix(
     cost_matrix: List[List[float]],
-    assignments: List[int],
-    u_potentials: List[float],
-    v_potentials: List[float],
     N: int,
     M: int,
-    pad_cost: float,
     sign: int,
     disallowment_map: Dict[int, Set[int]],
-) -> bool:
-    # For the solution to be optimal:
-    # The sum of potentials must be equal the sum of the total cost of assignments
-    u_sum = 0
-    v_sum = 0
-    cost_sum = 0
-    for i, j in enumerate(assignments):
-        if j == -1 or (i in disallowment_map and j in disallowment_map[i]):
+    transposed: bool,
+) -> Tuple[np.ndarray, np.ndarray, bool]:
+    # The cost matrix is a single C-contiguous buffer laid out as the solver scans it,
+    # so every solver row is a unit-stride run of doubles.
+    # When transposed, the input is written straight into the transposed layout,
+    # instead of being copied a second time.
+    C = np.empty((M, N) if transposed else (N, M), dtype=np.float64)
+    costs = C.T if transposed else C
+
+    # Signed costs of the input
+    costs[:] = cost_matrix
+    if sign != 1:
+        costs *= sign
+
+    # NaN costs count as zero, converted once here instead of being checked by the solver
+    # (infinite costs are kept)
+    np.nan_to_num(costs, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+
+    # Integer costs (up to 2^53) are exact as doubles, and so are their sums and differences
+    integral = bool(np.array_equal(costs, np.trunc(costs)))
+
+    # Bitmap of the disallowed assignments
+    disallowed = np.zeros((N, M), dtype=np.bool_)
+    for i, cols in disallowment_map.items():
+        # Indexes outside the matrix (negative ones included) can't match any assignment
+        if 0 <= i < N:
+            disallowed[i, [j for j in cols if 0 <= j < M]] = True
+
+    # Disallowed assignments always have an infinite cost
+    costs[disallowed] = np.inf
+
+    return C, disallowed, integral
+
+
+def __connected_components(C: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+    N, M = C.shape
+
+    # Rows and columns are linked by every assignment without an infinite cost
+    allowed = ~np.isposinf(C)
+
+    # Label rows and columns breadth-first, one component at a time
+    row_seen = np.zeros(N, dtype=np.bool_)
+    col_seen = np.zeros(M, dtype=np.bool_)
+    components = []
+    for i in range(N):
+        if row_seen[i]:
             continue
 
-        u_sum += u_potentials[i]
-        v_sum += v_potentials[j]
-
-        # Use padding cost if this cell is a padded cell
-        cost_sum += sign * cost_matrix[i][j] if i < N and j < M else pad_cost
-
-        # Also each reduced cost generated by the assignment must be 0
-        if (
-            abs(
-                __reduced_cost(
-                    cost_matrix,
-                    u_potentials,
-                    v_potentials,
-                    i,
-                    j,
-                    N,
-                    M,
-                    pad_cost,
-                    sign,
-                    disallowment_map,
-                )
+        row_seen[i] = True
+        rows = [np.array([i])]
+        cols = []
+        frontier = rows[0]
+        while frontier.size:
+            # Columns reached by the last visited rows
+            frontier = np.flatnonzero(allowed[frontier].any(axis=0) & ~col_seen)
+            if not frontier.size:
+                break
+            col_seen[frontier] = True
+            cols.append(frontier)
+
+            # Rows reached by the last visited columns
+            frontier = np.flatnonzero(allowed[:, frontier].any(axis=1) & ~row_seen)
+            row_seen[frontier] = True
+            rows.append(frontier)
+
+        components.append(
+            (
+                np.sort(np.concatenate(rows)),
+                np.sort(np.concatenate(cols)) if cols else np.empty(0, np.int64),
             )
-            >= __EPS
-        ):
-            return False
+        )
 
-    optimal = u_sum + v_sum == cost_sum
-    # Try to apply floating tolerance
-    return optimal if optimal else abs(cost_sum - u_sum - v_sum) < __EPS
+    # Columns without any allowed assignment are left out, they will stay free
+    return components
+
+
+def __solve_dense(
+    C: np.ndarray, method: str, eps: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    if np.isneginf(C).any():
+        return __solve_lexicographic(C, eps)
+
+    Z, inversions, u, v = __solve_kernel(C, method, eps)
+
+    # Some rows had to take +inf costs, make sure that as few rows as possible do
+    if -1 in Z or np.isposinf(C[np.arange(C.shape[0]), Z]).any():
+        return __solve_lexicographic(C, eps)
+
+    return Z, inversions, u, v
+
+
+def __solve_kernel(
+    C: np.ndarray, method: str, eps: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Initialize assignments (Z[i] -> j)
+    Z = np.full(C.shape[0], -1, dtype=np.int64)
+
+    # Initialize inversion vector (inversions[j] -> i)
+    inversions = np.full(C.shape[1], -1, dtype=np.int64)
+
+    # Shortest paths need finite potentials: -inf costs would make them infinite,
+    # and rows that can only reach a free column through +inf costs would be left unassigned
+    if method == "jv" and np.isfinite(C).all():
+        u, v = __jv_potentials(C, Z, inversions)
+        __solve_jv(C, u, v, Z, inversions)
+    else:
+        u, v = __hungarian_potentials(C)
+        __solve_hungarian(C, u, v, Z, inversions, eps)
+
+    return Z, inversions, u, v
+
+
+def __solve_lexicographic(
+    C: np.ndarray, eps: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # An optimal solution first takes as many -inf costs, and as few +inf costs, as possible,
+    # then minimizes the sum of the finite costs.
+    # Both goals are solved in turn, each one on a matrix without infinite costs to trade.
+    N, M = C.shape
+
+    # Exceeding columns are matched to dummy rows (i.e. left free) at no cost,
+    # so that every optimal solution is a perfect matching
+    # (only matrices with -inf costs, or that can't avoid +inf costs, take this path)
+    padded = np.zeros((M, M), dtype=np.float64)
+    padded[:N] = C
+    infinite = np.isinf(padded)
+
+    # First pass: every -inf cost counts as -1, every +inf cost as 1, any finite cost as 0
+    # (both passes run the Hungarian kernel, so that both methods return the same solution)
+    first = np.where(infinite, np.sign(padded), 0.0)
+    Z, inversions, u, v = __solve_kernel(first, "hungarian", 0.0)
+    if not __optimality_check(first, Z, u, v, 0.0):
+        # In theory this should not happen (the first pass is an integer problem),
+        # if it happens fall back to the solver heuristics
+        return __solve_kernel(C, "hungarian", eps)
+
+    # Every perfect matching with the same count of infinite costs only uses tight edges
+    # of the first pass (complementary slackness)
+    tight = first - u[:, None] - v[None, :] == 0
+
+    # Second pass: minimize the finite costs over the tight edges (infinite costs count as 0)
+    second = np.where(tight, np.where(infinite, 0.0, padded), np.inf)
+    Z, inversions, u, v = __solve_kernel(second, "hungarian", eps)
+
+    # Rows assigned to infinite costs get an infinite potential as well,
+    # so that their reduced costs still count as zero
+    cells = (np.arange(M), Z)
+    on_infinite = infinite[cells]
+    u[on_infinite] = padded[cells][on_infinite]
+
+    # Drop the dummy rows
+    Z = Z[:N]
+    inversions[inversions >= N] = -1
+    return Z, inversions, u[:N], v
+
+
+def __solve_components(
+    C: np.ndarray,
+    components: List[Tuple[np.ndarray, np.ndarray]],
+    method: str,
+    eps: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    N, M = C.shape
+    Z = np.full(N, -1, dtype=np.int64)
+    inversions = np.full(M, -1, dtype=np.int64)
+    u = np.zeros(N, dtype=np.float64)
+    v = np.zeros(M, dtype=np.float64)
+
+    for rows, cols in components:
+        if not cols.size:
+            # Rows without any allowed assignment are left over
+            continue
 
+        # Solve the block (transposed if it has more rows than columns),
+        # then splice its solution and potentials back into the whole problem
+        block = C[np.ix_(rows, cols)]
+        if rows.size > cols.size:
+            block_inv, block_Z, block_v, block_u = __solve_dense(
+                np.ascontiguousarray(block.T), method, eps
+            )
+        else:
+            block_Z, block_inv, block_u, block_v = __solve_dense(block, method, eps)
+
+        assigned = block_Z != -1
+        Z[rows[assigned]] = cols[block_Z[assigned]]
+        assigned = block_inv != -1
+        inversions[cols[assigned]] = rows[block_inv[assigned]]
+        u[rows] = block_u
+        v[cols] = block_v
+
+    # Rows left over by their block can only take +inf costs,
+    # they get the remaining free columns (as the whole matrix would have done)
+    free_rows = np.flatnonzero(Z == -1)
+    free_cols = np.flatnonzero(inversions == -1)[: free_rows.size]
+    free_rows = free_rows[: free_cols.size]
+    Z[free_rows] = free_cols
+    inversions[free_cols] = free_rows
+    # (an infinite potential, so that their reduced costs still count as zero)
+    u[free_rows] = np.inf
+
+    return Z, inversions, u, v
+
+
+def __hungarian_potentials(C: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Calculate potentials U (minimum for each row)
+    u = C.min(axis=1)
 
-def __reduced_cost(
-    cost_matrix: List[List[float]],
-    u_potentials: List[float],
-    v_potentials: List[float],
-    i: int,
-    j: int,
-    N: int,
-    M: int,
-    pad_cost: float,
-    sign: int,
-    disallowment_map: Dict[int, Set[int]],
-) -> float:
-    # Reduced cost
-    rc = (
-        (
-            # Disallowment check
-            float("inf")
-            if i in disallowment_map and j in disallowment_map[i]
-            # Padding check
-            else (sign * cost_matrix[i][j] if i < N and j < M else pad_cost)
+    if C.shape[0] == C.shape[1]:
+        # Calculate potentials V
+        # (minimum for each column - u[i], NaN reduced costs of infinite rows count as zero)
+        reduced = np.nan_to_num(
+            C - u[:, None], copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf
         )
-        - u_potentials[i]
-        - v_potentials[j]
+        v = reduced.min(axis=0)
+        # Columns made only of +inf costs would make every reduced cost of theirs NaN (tight),
+        # they keep potential 0 instead, so they are only reached when nothing finite is left
+        v[v == np.inf] = 0
+    else:
+        # Columns that can stay free must keep potentials at 0,
+        # otherwise the potentials could not certify optimality
+        v = np.zeros(C.shape[1], dtype=np.float64)
+
+    return u, v
+
+
+def __jv_potentials(
+    C: np.ndarray, assignments: np.ndarray, inversions: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    N, M = C.shape
+
+    if N < M or M == 1:
+        # Row reduction: U is the minimum of each row, V starts at 0
+        # (columns that can stay free must keep potentials at 0)
+        u = C.min(axis=1)
+        v = np.zeros(M, dtype=np.float64)
+
+        # Each row is assigned to the column holding its minimum (a zeroed reduced cost),
+        # as long as that column is still unassigned
+        min_cols = np.argmin(C, axis=1)
+        for i, j in enumerate(min_cols.tolist()):
+            if inversions[j] == -1:
+                assignments[i] = j
+                inversions[j] = i
+
+        return u, v
+
+    # Column reduction, then reduction transfer
+    v = np.empty(M, dtype=np.float64)
+    __reduce_columns(C, v, assignments, inversions)
+
+    # Rows holding no column minimum are assigned by augmenting row reduction
+    __augmenting_row_reduction(C, v, assignments, inversions)
+
+    u = np.empty(N, dtype=np.float64)
+    __reduce_rows(C, v, assignments, u)
+
+    return u, v
+
+
+def __solve_small(C: np.ndarray) -> Tuple[List[int], List[int], bool]:
+    rows = C.tolist()
+
+    # Cheapest permutation (for 2x2 this boils down to comparing the two diagonals)
+    Z = min(
+        permutations(range(len(rows))),
+        key=lambda cols: sum(row[j] for row, j in zip(rows, cols)),
     )
 
-    return 0 if isnan(rc) else rc
+    inversions = [-1] * len(Z)
+    for i, j in enumerate(Z):
+        inversions[j] = i
 
+    # Every permutation was compared, so the solution is always optimal
+    return list(Z), inversions, True
 
-def __search_augmented_path(
-    row_i: int,
-    cost_matrix: List[List[float]],
-    N: int,
-    M: int,
-    PAD_M: int,
-    pad_cost: float,
-    inversionVector: List[int],
-    u_potential: List[float],
-    v_potential: List[float],
-    S: Set[int],
-    T: Set[int],
-    sign: int,
-    disallowment_map: Dict[int, Set[int]],
-    path_found: bool = False,
-) -> Tuple[List[Tuple[int]], bool]:
-
-    # TODO Replace recursion with iterative approach as it may hit recursion limit
-
-    # Initialize (sub)path
-    path = []
-    for j in range(PAD_M):
-        # Find zeroed reduced cost in this row
-        rc = __reduced_cost(
-            cost_matrix,
-            u_potential,
-            v_potential,
-            row_i,
-            j,
-            N,
-            M,
-            pad_cost,
-            sign,
-            disallowment_map,
+
+def __optimality_check(
+    C: np.ndarray,
+    assignments: np.ndarray,
+    u_potentials: np.ndarray,
+    v_potentials: np.ndarray,
+    eps: float,
+) -> bool:
+    # Gather the costs and potentials of every assignment
+    rows = np.flatnonzero(assignments != -1)
+    cols = assignments[rows]
+    costs = C[rows, cols]
+    u_assigned = u_potentials[rows]
+    v_assigned = v_potentials[cols]
+
+    # For the solution to be optimal:
+    # The sum of potentials must be equal the sum of the total cost of assignments
+    u_sum = u_assigned.sum()
+    v_sum = v_assigned.sum()
+    cost_sum = costs.sum()
+    if u_sum + v_sum == cost_sum:
+        # Assigned edges are kept tight by the solver, so exact sums are enough
+        return True
+
+    # Try to apply floating tolerance (NaN sums are never optimal)
+    if not fabs(cost_sum - u_sum - v_sum) <= eps:
+        return False
+
+    # Within tolerance, also each reduced cost generated by the assignment must be 0
+    # (NaN reduced costs count as zero)
+    return not np.any(np.abs(costs - u_assigned - v_assigned) > eps)
+
+
+@__jit
+def __solve_hungarian(
+    C: np.ndarray,
+    u_potentials: np.ndarray,
+    v_potentials: np.ndarray,
+    assignments: np.ndarray,
+    inversions: np.ndarray,
+    eps: float,
+) -> None:
+    N, M = C.shape
+
+    # Visited columns (T) of the alternated path
+    T = np.zeros(M, dtype=np.bool_)
+
+    # Minimum reduced cost of each column over the visited rows,
+    # and the visited row that achieves it
+    slack = np.empty(M, dtype=np.float64)
+    slack_row = np.empty(M, dtype=np.int64)
+
+    # Row that reached each visited column in the alternated path
+    prev_row = np.full(M, -1, dtype=np.int64)
+
+    # Visited rows (S) in order of visit, the ones past the head of the queue are still to be scanned
+    queue = np.empty(N, dtype=np.int64)
+    # Visited columns in order of visit (visited[k] led to the row queue[k + 1])
+    visited = np.empty(N, dtype=np.int64)
+
+    # Iterate over unassigned rows
+    # (there are at most as many rows as columns, so a free column can always be reached)
+    for i in range(N):
+
+        # Initialize alternated path
+        T[:] = False
+        slack[:] = np.inf
+        slack_row[:] = i
+        queue[0] = i
+
+        # Walk through the alternated path to find an augmented path
+        free_col = __search_augmented_path(
+            C,
+            inversions,
+            u_potentials,
+            v_potentials,
+            T,
+            slack,
+            slack_row,
+            prev_row,
+            queue,
+            visited,
+            eps,
         )
-        if abs(rc) > __EPS or j in T:  # Also skip visited columns
+        if free_col != -1:
+            # Walk back through the augmented path and invert each arc to assign this row
+            __augment(i, free_col, assignments, inversions, prev_row)
+
+
+@__jit
+def __solve_jv(
+    C: np.ndarray,
+    u_potentials: np.ndarray,
+    v_potentials: np.ndarray,
+    assignments: np.ndarray,
+    inversions: np.ndarray,
+) -> None:
+    N, M = C.shape
+
+    # Shortest path distance of each unvisited column from the unassigned row,
+    # and final distance of each visited column
+    shortest = np.empty(M, dtype=np.float64)
+    distance = np.empty(M, dtype=np.float64)
+
+    # Visited columns (SC), in order of visit
+    SC = np.zeros(M, dtype=np.bool_)
+    visited = np.empty(M, dtype=np.int64)
+
+    # Row that reached each column on its shortest path
+    prev_row = np.full(M, -1, dtype=np.int64)
+
+    # Iterate over the rows left unassigned by the initial reductions
+    for i in range(N):
+        if assignments[i] != -1:
             continue
 
-        # Initialize subpath
-        path = [(row_i, j)]
-
-        # Check if this column is free
-        if inversionVector[j] == -1:
-            # Return the augmented path
-            return path, True
-
-        # Check if the subpath brings to a cycle
-        if inversionVector[j] in S:
-            return [], False
-
-        # Update alternated path
-        T.add(j)  # Add j to the visited columns
-        S.add(inversionVector[j])  # Visit the row that occupies this column
-
-        # Extend alternated path until we find a free column or a wall
-        new_path, path_found = __search_augmented_path(
-            inversionVector[j],
-            cost_matrix,
-            N,
-            M,
-            PAD_M,
-            pad_cost,
-            inversionVector,
-            u_potential,
-            v_potential,
-            S,
-            T,
-            sign,
-            disallowment_map,
-            path_found=path_found,
+        # Find the shortest augmenting path for this row (and update the potentials)
+        sink = __shortest_augmenting_path(
+            i,
+            C,
+            inversions,
+            u_potentials,
+            v_potentials,
+            shortest,
+            distance,
+            SC,
+            visited,
+            prev_row,
         )
+        if sink != -1:
+            # Walk back through the augmented path and invert each arc to assign this row
+            __augment(i, sink, assignments, inversions, prev_row)
+
+
+def __reduce_columns_vectorized(
+    C: np.ndarray,
+    v_potentials: np.ndarray,
+    assignments: np.ndarray,
+    inversions: np.ndarray,
+) -> None:
+    # Column reduction: V is the minimum of each column,
+    # and each row is assigned to the first column holding its minimum
+    v_potentials[:] = C.min(axis=0)
+    min_rows = np.argmin(C, axis=0)
+    rows, cols = np.unique(min_rows, return_index=True)
+    assignments[rows] = cols
+    inversions[cols] = rows
+
+    # Reduction transfer: rows holding a single column minimum lower the potential of their column
+    # down to the second lowest reduced cost of the row, so they still prefer that column
+    # (lowering V only makes the reduced costs of the other rows higher)
+    rows = rows[np.bincount(min_rows, minlength=C.shape[0])[rows] == 1]
+    cols = assignments[rows]
+    reduced = C[rows] - v_potentials
+    reduced[np.arange(rows.size), cols] = np.inf
+    v_potentials[cols] -= reduced.min(axis=1)
+
+
+@__kernel(fallback=__reduce_columns_vectorized)
+def __reduce_columns(
+    C: np.ndarray,
+    v_potentials: np.ndarray,
+    assignments: np.ndarray,
+    inversions: np.ndarray,
+) -> None:
+    N, M = C.shape
+
+    # Column reduction: V is the minimum of each column
+    # (scanned row by row, in memory order)
+    min_rows = np.zeros(M, dtype=np.int64)
+    v_potentials[:] = C[0]
+    for i in range(1, N):
+        for j in range(M):
+            if C[i, j] < v_potentials[j]:
+                v_potentials[j] = C[i, j]
+                min_rows[j] = i
+
+    # Each row is assigned to the first column holding its minimum
+    matches = np.zeros(N, dtype=np.int64)
+    for j in range(M):
+        i = min_rows[j]
+        if matches[i] == 0:
+            assignments[i] = j
+            inversions[j] = i
+        matches[i] += 1
+
+    # Reduction transfer: rows holding a single column minimum lower the potential of their column
+    # down to the second lowest reduced cost of the row, so they still prefer that column
+    # (every transfer is computed on the column minima first, then applied)
+    transfer = np.zeros(N, dtype=np.float64)
+    for i in range(N):
+        if matches[i] == 1:
+            j1 = assignments[i]
+            transfer[i] = np.inf
+            for j in range(M):
+                if j != j1 and C[i, j] - v_potentials[j] < transfer[i]:
+                    transfer[i] = C[i, j] - v_potentials[j]
+    for i in range(N):
+        if matches[i] == 1:
+            v_potentials[assignments[i]] -= transfer[i]
+
+
+def __reduce_rows_vectorized(
+    C: np.ndarray,
+    v_potentials: np.ndarray,
+    assignments: np.ndarray,
+    u_potentials: np.ndarray,
+) -> None:
+    # U: free rows take their lowest reduced cost,
+    # every assigned row holds the lowest reduced cost of its row (a zeroed reduced cost)
+    u_potentials[:] = (C - v_potentials).min(axis=1)
+    rows = np.flatnonzero(assignments != -1)
+    cols = assignments[rows]
+    u_potentials[rows] = C[rows, cols] - v_potentials[cols]
+
+
+@__kernel(fallback=__reduce_rows_vectorized)
+def __reduce_rows(
+    C: np.ndarray,
+    v_potentials: np.ndarray,
+    assignments: np.ndarray,
+    u_potentials: np.ndarray,
+) -> None:
+    # U: free rows take their lowest reduced cost,
+    # every assigned row holds the lowest reduced cost of its row (a zeroed reduced cost)
+    for i in range(C.shape[0]):
+        j = assignments[i]
+        if j != -1:
+            u_potentials[i] = C[i, j] - v_potentials[j]
+            continue
 
-        # Build the alternated path
-        path.extend(new_path)
-        if path_found:
-            # An augmented path was found, stop the search
+        u_potentials[i] = np.inf
+        for j in range(C.shape[1]):
+            if C[i, j] - v_potentials[j] < u_potentials[i]:
+                u_potentials[i] = C[i, j] - v_potentials[j]
+
+
+@__jit
+def __augmenting_row_reduction(
+    C: np.ndarray,
+    v_potentials: np.ndarray,
+    assignments: np.ndarray,
+    inversions: np.ndarray,
+) -> None:
+    # Free rows, and the ones freed by the current pass
+    free = np.flatnonzero(assignments == -1)
+    n_free = free.size
+
+    # On float costs, freed rows can keep taking each other's column back,
+    # lowering its potential by tiny amounts every time:
+    # past a few steps per row, shortest augmenting paths are cheaper
+    steps = 0
+    max_steps = 4 * C.shape[0]
+
+    # Two passes over the free rows, each of them takes its cheapest column,
+    # possibly freeing the row that held it
+    for _ in range(2):
+        k = 0
+        prev_n_free = n_free
+        n_free = 0
+        while k < prev_n_free:
+            i = free[k]
+            k += 1
+            steps += 1
+
+            # Lowest and second lowest reduced costs of the row
+            u1, j1, u2, j2 = __two_lowest(C[i], v_potentials)
+
+            i0 = inversions[j1]
+            if u1 < u2:
+                # Lower the potential of the cheapest column,
+                # so that the row is still tight on it, tied with the second cheapest one
+                v_potentials[j1] -= u2 - u1
+            elif i0 != -1:
+                # Both columns are tied, prefer the second one if the first one is taken
+                j1 = j2
+                i0 = inversions[j2]
+
+            assignments[i] = j1
+            inversions[j1] = i
+            if i0 != -1:
+                assignments[i0] = -1
+                if u1 < u2 and steps < max_steps:
+                    # The potential went down, reassign the freed row right away
+                    k -= 1
+                    free[k] = i0
+                else:
+                    # Otherwise wait for the next pass, avoiding cycles between tied rows
+                    free[n_free] = i0
+                    n_free += 1
+
+
+def __two_lowest_vectorized(
+    costs: np.ndarray, v_potentials: np.ndarray
+) -> Tuple[float, int, float, int]:
+    reduced = costs - v_potentials
+    j1 = int(np.argmin(reduced))
+    u1 = reduced[j1]
+    reduced[j1] = np.inf
+    j2 = int(np.argmin(reduced))
+    return u1, j1, reduced[j2], j2
+
+
+@__kernel(fallback=__two_lowest_vectorized)
+def __two_lowest(
+    costs: np.ndarray, v_potentials: np.ndarray
+) -> Tuple[float, int, float, int]:
+    # Lowest and second lowest reduced cost of a row (and their first columns), in a single pass
+    u1 = costs[0] - v_potentials[0]
+    j1 = 0
+    u2 = np.inf
+    j2 = 0
+    for j in range(1, costs.size):
+        reduced = costs[j] - v_potentials[j]
+        if reduced < u2:
+            if reduced >= u1:
+                u2 = reduced
+                j2 = j
+            else:
+                u2 = u1
+                j2 = j1
+                u1 = reduced
+                j1 = j
+    return u1, j1, u2, j2
+
+
+def __search_augmented_path_vectorized(
+    C: np.ndarray,
+    inversions: np.ndarray,
+    u_potentials: np.ndarray,
+    v_potentials: np.ndarray,
+    T: np.ndarray,
+    slack: np.ndarray,
+    slack_row: np.ndarray,
+    prev_row: np.ndarray,
+    queue: np.ndarray,
+    visited: np.ndarray,
+    eps: float,
+) -> int:
+
+    # Scratch buffers for the reduced costs of a row, reused by every visited row
+    rc = np.empty(C.shape[1], dtype=np.float64)
+    mask = np.empty(C.shape[1], dtype=np.bool_)
+
+    # Grow the alternated tree breadth-first, starting from the unassigned row in the queue
+    head = 0
+    tail = 1
+    while True:
+        # Visit the unvisited columns with zeroed reduced cost
+        # (visited columns always have an infinite slack)
+        for j in np.flatnonzero(np.abs(slack) <= eps):
+            prev_row[j] = slack_row[j]
+
+            # Check if this column is free
+            if inversions[j] == -1:
+                return j
+
+            # Update alternated path
+            T[j] = True  # Visit column j
+            slack[j] = np.inf
+            visited[tail - 1] = j
+            queue[tail] = inversions[j]  # Visit the row that occupies this column
+            tail += 1
+
+        if head < tail:
+            # Scan the reduced costs of the next visited row (NaN reduced costs count as zero)
+            row = queue[head]
+            head += 1
+            np.subtract(C[row], u_potentials[row], rc)
+            np.subtract(rc, v_potentials, rc)
+            np.isnan(rc, mask)
+            rc[mask] = 0.0
+            rc[T] = np.inf
+
+            # Keep the lowest reduced cost of each column over the visited rows
+            np.less(rc, slack, mask)
+            slack[mask] = rc[mask]
+            slack_row[mask] = row
+            continue
+
+        # Calculate delta
+        # (minimum reduced cost considering all visited rows,
+        #  and all unvisited columns in the alternated path)
+        # (a single reduction, since visited columns have an infinite slack)
+        delta = slack.min()
+
+        if fabs(delta) <= eps:
+            # In theory this should not happen, floating-point rounding or pathological matrices could trigger this.
+            # if it happens leave this row unassigned
+            return -1
+
+        # Update potentials in place, only touching the visited rows and columns
+        rows = queue[:tail]
+        cols = visited[: tail - 1]
+        # Add delta to the potentials of all visited rows in the alternated path
+        u_potentials[rows] += delta
+        # Subtract delta from the potentials of all visited columns in the alternated path
+        v_potentials[cols] -= delta
+
+        if np.isinf(delta):
+            # NaN values (only an infinite delta can produce them) are converted to 0
+            u_potentials[np.isnan(u_potentials)] = 0
+            v_potentials[np.isnan(v_potentials)] = 0
+
+        # Reduced costs of the unvisited columns decrease by delta for all visited rows,
+        # so at least one of them gets zeroed
+        slack -= delta
+        if np.isinf(delta):
+            # Infinite slacks minus an infinite delta count as zero,
+            # but visited columns must stay out of reach
+            slack[np.isnan(slack)] = 0
+            slack[T] = np.inf
+
+
+@__kernel(fallback=__search_augmented_path_vectorized)
+def __search_augmented_path(
+    C: np.ndarray,
+    inversions: np.ndarray,
+    u_potentials: np.ndarray,
+    v_potentials: np.ndarray,
+    T: np.ndarray,
+    slack: np.ndarray,
+    slack_row: np.ndarray,
+    prev_row: np.ndarray,
+    queue: np.ndarray,
+    visited: np.ndarray,
+    eps: float,
+) -> int:
+    M = C.shape[1]
+
+    # Grow the alternated tree breadth-first, starting from the unassigned row in the queue
+    head = 0
+    tail = 1
+    while True:
+        row = -1
+        u_row = 0.0
+        delta = 0.0
+        if head < tail:
+            # Scan the reduced costs of the next visited row
+            row = queue[head]
+            head += 1
+            u_row = u_potentials[row]
+        else:
+            # Calculate delta
+            # (minimum reduced cost considering all visited rows,
+            #  and all unvisited columns in the alternated path)
+            # (a single reduction, since visited columns have an infinite slack)
+            delta = slack.min()
+
+            if fabs(delta) <= eps:
+                # In theory this should not happen, floating-point rounding or pathological matrices could trigger this.
+                # if it happens leave this row unassigned
+                return -1
+
+            # Update potentials in place, only touching the visited rows and columns
+            # (NaN values, only an infinite delta can produce them, are converted to 0)
+            for k in range(tail):
+                potential = u_potentials[queue[k]] + delta
+                u_potentials[queue[k]] = 0.0 if potential != potential else potential
+            for k in range(tail - 1):
+                potential = v_potentials[visited[k]] - delta
+                v_potentials[visited[k]] = 0.0 if potential != potential else potential
+
+        # A single pass over the unvisited columns updates their slack,
+        # and visits the ones that get a zeroed reduced cost
+        for j in range(M):
+            if T[j]:
+                continue
+
+            if row != -1:
+                # Keep the lowest reduced cost of each column over the visited rows
+                # (NaN reduced costs count as zero)
+                reduced = C[row, j] - u_row - v_potentials[j]
+                if reduced != reduced:
+                    reduced = 0.0
+                if reduced < slack[j]:
+                    slack[j] = reduced
+                    slack_row[j] = row
+            else:
+                # Reduced costs of the unvisited columns decrease by delta for all visited rows,
+                # so at least one of them gets zeroed
+                # (infinite slacks minus an infinite delta count as zero)
+                reduced = slack[j] - delta
+                slack[j] = 0.0 if reduced != reduced else reduced
+
+            if fabs(slack[j]) <= eps:
+                prev_row[j] = slack_row[j]
+
+                # Check if this column is free
+                if inversions[j] == -1:
+                    return j
+
+                # Update alternated path
+                T[j] = True  # Visit column j
+                slack[j] = np.inf
+                visited[tail - 1] = j
+                queue[tail] = inversions[j]  # Visit the row that occupies this column
+                tail += 1
+
+
+def __shortest_augmenting_path_vectorized(
+    row_i: int,
+    C: np.ndarray,
+    inversions: np.ndarray,
+    u_potentials: np.ndarray,
+    v_potentials: np.ndarray,
+    shortest: np.ndarray,
+    distance: np.ndarray,
+    SC: np.ndarray,
+    visited: np.ndarray,
+    prev_row: np.ndarray,
+) -> int:
+
+    # Scratch buffers for the reduced costs of a row, reused by every scanned row
+    rc = np.empty(C.shape[1], dtype=np.float64)
+    mask = np.empty(C.shape[1], dtype=np.bool_)
+
+    # Dijkstra over the columns, using reduced costs as (non negative) arc lengths
+    shortest[:] = np.inf
+    SC[:] = False
+    n_visited = 0
+    n_scanned = 0
+    min_val = -np.inf
+    row = row_i
+    u_row = u_potentials[row_i]
+    while True:
+        # Relax the distances of the unvisited columns through this row
+        # (the distance of this row is folded into its potential)
+        np.subtract(C[row], u_row, rc)
+        np.subtract(rc, v_potentials, rc)
+        rc[SC] = np.inf
+
+        np.less(rc, shortest, mask)
+        shortest[mask] = rc[mask]
+        prev_row[mask] = row
+
+        # Columns as close as the visited ones are visited right away
+        closest = np.flatnonzero(mask & (rc <= min_val))
+
+        if not closest.size and n_scanned == n_visited:
+            # Every visited column was scanned, visit all the closest unvisited columns
+            # (visited columns always have an infinite distance here)
+            min_val = shortest.min()
+            if min_val == np.inf:
+                # No free column can be reached, leave this row unassigned
+                return -1
+            closest = np.flatnonzero(shortest == min_val)
+
+        # Free columns end the search
+        free = closest[inversions[closest] == -1]
+        if free.size:
+            j = free[0]
             break
 
-    # Return the alternated path
-    # (if path_found = True it's an augmented path)
-    return path, path_found
+        # Visit the columns (their distance is now final)
+        SC[closest] = True
+        distance[closest] = shortest[closest]
+        shortest[closest] = np.inf
+        visited[n_visited : n_visited + closest.size] = closest
+        n_visited += closest.size
+
+        # Continue from the row that occupies the next visited column
+        j = visited[n_scanned]
+        n_scanned += 1
+        row = inversions[j]
+        u_row = u_potentials[row] - distance[j]
+
+    # Update potentials, so that every arc of the shortest path tree gets a zeroed reduced cost
+    # (columns visited but not scanned are as far as the free column, they keep their potential)
+    u_potentials[row_i] += min_val
+    cols = visited[:n_scanned]
+    u_potentials[inversions[cols]] += min_val - distance[cols]
+    # (distances are finite here, so no NaN potential can come out of this update)
+    v_potentials[cols] -= min_val - distance[cols]
+
+    return j
+
+
+@__kernel(fallback=__shortest_augmenting_path_vectorized)
+def __shortest_augmenting_path(
+    row_i: int,
+    C: np.ndarray,
+    inversions: np.ndarray,
+    u_potentials: np.ndarray,
+    v_potentials: np.ndarray,
+    shortest: np.ndarray,
+    distance: np.ndarray,
+    SC: np.ndarray,
+    visited: np.ndarray,
+    prev_row: np.ndarray,
+) -> int:
+    M = C.shape[1]
+
+    # Dijkstra over the columns, using reduced costs as (non negative) arc lengths.
+    # All the closest columns are visited at once, so the unvisited columns are only searched
+    # for the next closest ones after every visited column was scanned.
+    shortest[:] = np.inf
+    SC[:] = False
+    n_visited = 0
+    n_scanned = 0
+    min_val = -np.inf
+    row = row_i
+    u_row = u_potentials[row_i]
+    while True:
+        # A single pass over the unvisited columns relaxes their distances through this row,
+        # and visits the ones as close as the visited columns right away
+        # (the distance of this row is folded into its potential)
+        for k in range(M):
+            if SC[k]:
+                continue
+
+            reduced = C[row, k] - u_row - v_potentials[k]
+            if reduced < shortest[k]:
+                shortest[k] = reduced
+                prev_row[k] = row
+
+                if reduced <= min_val:
+                    # Free columns end the search
+                    if inversions[k] == -1:
+                        return __update_potentials(
+                            row_i,
+                            k,
+                            min_val,
+                            inversions,
+                            u_potentials,
+                            v_potentials,
+                            distance,
+                            visited,
+                            n_scanned,
+                        )
+
+                    SC[k] = True
+                    distance[k] = reduced
+                    visited[n_visited] = k
+                    n_visited += 1
+
+        if n_scanned == n_visited:
+            # Every visited column was scanned, visit all the closest unvisited columns
+            min_val = np.inf
+            level = n_visited
+            for k in range(M):
+                if not SC[k] and shortest[k] <= min_val:
+                    if shortest[k] < min_val:
+                        min_val = shortest[k]
+                        n_visited = level
+                    visited[n_visited] = k
+                    n_visited += 1
+
+            if min_val == np.inf:
+                # No free column can be reached, leave this row unassigned
+                return -1
+
+            for idx in range(level, n_visited):
+                k = visited[idx]
+                # Free columns end the search
+                if inversions[k] == -1:
+                    return __update_potentials(
+                        row_i,
+                        k,
+                        min_val,
+                        inversions,
+                        u_potentials,
+                        v_potentials,
+                        distance,
+                        visited,
+                        n_scanned,
+                    )
+
+                # Visit the column (its distance is now final)
+                SC[k] = True
+                distance[k] = min_val
+
+        # Continue from the row that occupies the next visited column
+        j = visited[n_scanned]
+        n_scanned += 1
+        row = inversions[j]
+        u_row = u_potentials[row] - distance[j]
+
+
+@__jit
+def __update_potentials(
+    row_i: int,
+    free_col: int,
+    min_val: float,
+    inversions: np.ndarray,
+    u_potentials: np.ndarray,
+    v_potentials: np.ndarray,
+    distance: np.ndarray,
+    visited: np.ndarray,
+    n_scanned: int,
+) -> int:
+    # Update potentials, so that every arc of the shortest path tree gets a zeroed reduced cost
+    # (columns visited but not scanned are as far as the free column, they keep their potential)
+    u_potentials[row_i] += min_val
+    for k in range(n_scanned):
+        col = visited[k]
+        u_potentials[inversions[col]] += min_val - distance[col]
+        v_potentials[col] -= min_val - distance[col]
+
+    return free_col
+
+
+@__jit
+def __augment(
+    row_i: int,
+    free_col: int,
+    assignments: np.ndarray,
+    inversions: np.ndarray,
+    prev_row: np.ndarray,
+) -> None:
+    # Walk back from the free column through the predecessors,
+    # assigning each row of the augmented path to the column it reached
+    j = free_col
+    while True:
+        row = prev_row[j]
+        next_j = assignments[row]
+        assignments[row] = j
+        inversions[j] = row
+        if row == row_i:
+            break
+        j = next_j
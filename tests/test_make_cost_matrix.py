@@ -0,0 +1,48 @@
+from pymunkres import make_cost_matrix
+import unittest
+
+
+class Test_MakeCostMatrix(unittest.TestCase):
+
+    workers = [1.0, 4.0, 1.0, 10.0, 4.0]
+    jobs = [2.0, 3.5, 2.0]
+
+    def test_memoize(self):
+        calls = []
+
+        def cost_function(a, b, i, j):
+            calls.append((a, b))
+            return abs(a - b)
+
+        exp_cost_matrix = make_cost_matrix(self.workers, self.jobs, cost_function)
+        calls.clear()
+
+        cost_matrix = make_cost_matrix(
+            self.workers, self.jobs, cost_function, memoize=True
+        )
+        self.assertEqual(exp_cost_matrix, cost_matrix)
+
+        # Called once for each distinct (worker, job) pair of values
+        self.assertEqual(len(calls), len(set(calls)))
+        self.assertEqual(set(calls), {(a, b) for a in self.workers for b in self.jobs})
+
+    def test_vectorized(self):
+        # The same expression works on scalars and on NumPy arrays
+        cost_function = lambda a, b, i, j: abs(a - b) + i * j
+
+        exp_cost_matrix = make_cost_matrix(self.workers, self.jobs, cost_function)
+        cost_matrix = make_cost_matrix(
+            self.workers, self.jobs, cost_function, vectorized=True
+        )
+        self.assertEqual(exp_cost_matrix, cost_matrix)
+
+    def test_vectorized_broadcast(self):
+        # Results that do not depend on every argument are broadcast to the full matrix
+        cost_matrix = make_cost_matrix(
+            self.workers, self.jobs, lambda a, b, i, j: a * 2, vectorized=True
+        )
+        self.assertEqual(cost_matrix, [[a * 2] * len(self.jobs) for a in self.workers])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,7 +24,7 @@ class Test_OptimalMaximization(unittest.TestCase):
                 [float("inf"), float("inf"), 1],
                 [float("inf"), 7, float("inf")],
             ],
-            [2, 1, 0],
+            [1, 0, 2],
             float("inf"),
         ),
         # Square 4 (3x3)
@@ -110,7 +110,7 @@ class Test_OptimalMaximization(unittest.TestCase):
                 [9, 6, 3, 1, 8, 5, 7, 8, 7, 2, 1, 8, 2, 8, 3, 7, 4, 8, 7, 7],
                 [8, 4, 4, 9, 7, 10, 6, 2, 1, 5, 8, 5, 1, 1, 1, 9, 1, 3, 5, 3],
             ],
-            [18, 2, 13, 14, 16, 1, 4, 3, 17, 11, 15, 8, 10, 9, 6, 0, 12, 19, 7, 5],
+            [18, 2, 7, 14, 16, 1, 4, 3, 10, 11, 13, 8, 6, 9, 15, 0, 12, 19, 17, 5],
             193,
         ),
     ]
@@ -146,6 +146,23 @@ class Test_OptimalMaximization(unittest.TestCase):
                 2: {0, 1, 2},  # Disallow Worker 2 -> Job 0, 1, 2
             },
         ),
+        # Square (Disallow) 3 (4x4, two independent blocks)
+        (
+            [
+                [4, 1, 0, 0],
+                [2, 6, 0, 0],
+                [0, 0, 3, 5],
+                [0, 0, 8, 1],
+            ],
+            [0, 1, 3, 2],
+            23,
+            {
+                0: {2, 3},
+                1: {2, 3},
+                2: {0, 1},
+                3: {0, 1},
+            },
+        ),
     ]
 
     test_cases_neg_square = [
@@ -188,7 +205,7 @@ class Test_OptimalMaximization(unittest.TestCase):
                 [59, 43, 97, 88, 48],
                 [52, 19, 89, 60, 60],
             ],
-            [0, 1, 3, 2, 4],
+            [0, 2, 1, 3, 4],
             392,
         ),
     ]
@@ -224,13 +241,13 @@ class Test_OptimalMaximization(unittest.TestCase):
         # Negative Rectangular 1 (3x4)
         (
             [[-400, -150, -400, -1], [-400, -450, -600, -2], [-300, -225, -300, -3]],
-            [1, 3, 2],
+            [1, 3, 0],
             -452,
         ),
         # Negative Rectangular 2 (3x4)
         (
             [[-10, -10, -8, -11], [-9, -8, -1, -1], [-9, -7, -4, -10]],
-            [1, 3, 2],
+            [0, 3, 2],
             -15,
         ),
     ]
@@ -299,7 +316,7 @@ class Test_OptimalMaximization(unittest.TestCase):
                 [9.0361, 6.0362, 3.0363, 1.0364, 8.0365, 5.0366, 7.0367, 8.0368, 7.0369, 2.037, 1.0371, 8.0372, 2.0373, 8.0374, 3.0375, 7.0376, 4.0377, 8.0378, 7.0379, 7.038, float('-inf')],
                 [8.0381, 4.0382, 4.0383, 9.0384, 7.0385, 10.0386, 6.0387, 2.0388, 1.0389, 5.039, 8.0391, 5.0392, 1.0393, 1.0394, 1.0395, 9.0396, 1.0397, 3.0398, 5.0399, 3.04, float('-inf')],
             ],
-            [18, 2, 13, 14, 16, 1, 4, 3, 17, 11, 15, 8, 10, 9, 6, 0, 12, 19, 7, 5], 193.401,
+            [18, 2, 7, 14, 16, 1, 4, 3, 17, 11, 15, 8, 10, 9, 6, 0, 12, 19, 13, 5], 193.401,
         ),
         # fmt: on
     ]
@@ -361,8 +378,8 @@ class Test_OptimalMaximization(unittest.TestCase):
                 [0, 157.0, 0],
                 [37.0, 0, 5.0],
             ],
-            [-1, -1, 1, 0],
-            194.0,
+            [1, -1, -1, 0],
+            198.0,
             {
                 0: {0, 2},
                 1: {0, 2},
@@ -383,12 +400,28 @@ class Test_OptimalMaximization(unittest.TestCase):
                 [59.16, 43.17, 97.18, 88.19, 48.2],
                 [52.21, 19.22, 89.23, 60.24, 60.25],
             ],
-            [0, 1, 3, 2, 4],
+            [0, 2, 1, 3, 4],
             392.65,
         ),
     ]
 
-    def _test_optimal(self, i, test_case, is_float: bool = False):
+    test_cases_infinite = [
+        # Infinite Square 1 (4x4, +inf profits)
+        (
+            [
+                [1, float("inf"), 2, 0],
+                [3, float("inf"), 4, 1],
+                [5, 6, 7, 2],
+                [1, 1, 1, 9],
+            ],
+            [1, 0, 2, 3],
+            float("inf"),
+        ),
+    ]
+
+    def _test_optimal(
+        self, i, test_case, is_float: bool = False, method: str = "hungarian"
+    ):
 
         solvable = True
         disallowment_map = {}
@@ -402,7 +435,10 @@ class Test_OptimalMaximization(unittest.TestCase):
             )
 
         assignments, inversions, is_optimal = munkres(
-            profit_matrix, disallowment_map=disallowment_map, maximization=True
+            profit_matrix,
+            disallowment_map=disallowment_map,
+            maximization=True,
+            method=method,
         )
         total_profit = sum(
             profit_matrix[i][j] if j != -1 else 0 for i, j in enumerate(assignments)
@@ -460,6 +496,12 @@ class Test_OptimalMaximization(unittest.TestCase):
         for i, test_case in enumerate(self.test_cases_float_rect_disallow):
             self._test_optimal(i, test_case, is_float=True)
 
+    def test_optimal_infinite(self):
+        # Both methods must agree on infinite profits
+        for method in ("hungarian", "jv"):
+            for i, test_case in enumerate(self.test_cases_infinite):
+                self._test_optimal(i, test_case, method=method)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -30,7 +30,7 @@ class Test_OptimalMinimization(unittest.TestCase):
         # Square 4 (3x3)
         (
             [[5, 9, 1], [10, 3, 2], [8, 7, 4]],
-            [2, 1, 0],
+            [0, 1, 2],
             12,
         ),
         # Square 5 (5x5)
@@ -110,9 +110,21 @@ class Test_OptimalMinimization(unittest.TestCase):
                 [9, 6, 3, 1, 8, 5, 7, 8, 7, 2, 1, 8, 2, 8, 3, 7, 4, 8, 7, 7],
                 [8, 4, 4, 9, 7, 10, 6, 2, 1, 5, 8, 5, 1, 1, 1, 9, 1, 3, 5, 3],
             ],
-            [16, 15, 4, 1, 3, 6, 0, 11, 14, 2, 8, 17, 12, 5, 19, 13, 18, 9, 10, 7],
+            [16, 15, 4, 1, 3, 6, 0, 11, 14, 9, 2, 17, 12, 5, 19, 13, 18, 7, 10, 8],
             22,
         ),
+        # Square 10 (1x1)
+        (
+            [[7]],
+            [0],
+            7,
+        ),
+        # Square 11 (2x2)
+        (
+            [[4, 1], [2, 6]],
+            [1, 0],
+            3,
+        ),
     ]
 
     test_cases_square_disallow = [
@@ -178,6 +190,46 @@ class Test_OptimalMinimization(unittest.TestCase):
                 2: {0, 3},
             },
         ),
+        # Square (Disallow) 5 (1x1)
+        (
+            [[7]],
+            [-1],
+            0,
+            {
+                0: {0},
+            },
+        ),
+        # Square (Disallow) 6 (4x4, two independent blocks)
+        (
+            [
+                [4, 1, 0, 0],
+                [2, 6, 0, 0],
+                [0, 0, 3, 5],
+                [0, 0, 8, 1],
+            ],
+            [1, 0, 2, 3],
+            7,
+            {
+                0: {2, 3},
+                1: {2, 3},
+                2: {0, 1},
+                3: {0, 1},
+            },
+        ),
+        # Square (Disallow) 7 (2x2, indexes outside the matrix are ignored)
+        (
+            [
+                [5, 1],
+                [1, 5],
+            ],
+            [1, 0],
+            2,
+            {
+                -1: {0},
+                0: {-1, 2},
+                7: {1},
+            },
+        ),
     ]
 
     test_cases_neg_square = [
@@ -200,7 +252,7 @@ class Test_OptimalMinimization(unittest.TestCase):
                 [float("-inf"), float("-inf"), -1],
                 [float("-inf"), -7, float("-inf")],
             ],
-            [2, 1, 0],
+            [1, 0, 2],
             float("-inf"),
         ),
         # Negative Square 4 (5x5)
@@ -224,22 +276,33 @@ class Test_OptimalMinimization(unittest.TestCase):
                 [-59, -43, -97, -88, -48],
                 [-52, -19, -89, -60, -60],
             ],
-            [0, 1, 3, 2, 4],
+            [0, 2, 1, 3, 4],
             -392,
         ),
+        # Negative Square 6 (4x4, mixed signs)
+        (
+            [
+                [-3, 7, 0, -12],
+                [5, -8, 2, 4],
+                [-6, 1, 9, -2],
+                [0, -4, -7, 3],
+            ],
+            [3, 1, 0, 2],
+            -33,
+        ),
     ]
 
     test_cases_rect = [
         # Rectangular 1 (3x4)
         (
             [[400, 150, 400, 1], [400, 450, 600, 2], [300, 225, 300, 3]],
-            [1, 3, 2],
+            [1, 3, 0],
             452,
         ),
         # Rectangular 2 (3x4)
         (
             [[10, 10, 8, 11], [9, 8, 1, 1], [9, 7, 4, 10]],
-            [1, 3, 2],
+            [0, 3, 2],
             15,
         ),
         # Rectangular 3 (5x4)
@@ -279,7 +342,7 @@ class Test_OptimalMinimization(unittest.TestCase):
                 [10.4, 3.5, 2.6],
                 [8.7, 7.8, 4.9],
             ],
-            [2, 1, 0],
+            [0, 1, 2],
             13.5,
         ),
         # Floating Square 2 (5x5)
@@ -430,8 +493,8 @@ class Test_OptimalMinimization(unittest.TestCase):
                 [0, 0, 0, 0, 0, 0, 0, 0.73182464, 0, 0, 0.46443561, 0.38589284, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
                 [0.29510278, 0, 0, 0, 0, 0, 0, 0, 0.09666032, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
             ],
-            [13, 14, 15, 16, 17, 18, 19, 20, 21, 4, 3, 9, 5, 8, -1, -1, 1, 12, 6, 7, 11, 0],
-            3.98942308,
+            [13, 14, 15, 16, 17, 18, 19, 20, 21, 4, 3, 9, 5, 2, 8, -1, 1, 12, 6, 7, 11, 0],
+            3.29809779,
             {
                 0: {0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 14, 15, 16, 17, 18, 19, 20, 21}, 
                 1: {0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21}, 
@@ -485,8 +548,8 @@ class Test_OptimalMinimization(unittest.TestCase):
                 [0, 157.0, 0],
                 [37.0, 0, 5.0],
             ],
-            [-1, -1, 1, 0],
-            194.0,
+            [-1, 1, -1, 2],
+            6.0,
             {
                 0: {0, 2},
                 1: {0, 2},
@@ -494,7 +557,24 @@ class Test_OptimalMinimization(unittest.TestCase):
                 3: {1},
             },
             False,  # Unsolvable
-        )
+        ),
+        # Floating Rectangular (Disallow) 2 (4x3, a single block)
+        (
+            [
+                [0, 161.0, 0],
+                [0, 1.0, 0],
+                [0, 157.0, 0],
+                [37.0, 0, 5.0],
+            ],
+            [-1, 1, -1, 2],
+            6.0,
+            {
+                0: {0, 2},
+                1: {0, 2},
+                2: {0, 2},
+            },
+            False,  # Unsolvable
+        ),
     ]
 
     test_cases_float_square_neg = [
@@ -507,12 +587,46 @@ class Test_OptimalMinimization(unittest.TestCase):
                 [-59.16, -43.17, -97.18, -88.19, -48.2],
                 [-52.21, -19.22, -89.23, -60.24, -60.25],
             ],
-            [0, 1, 3, 2, 4],
+            [0, 2, 1, 3, 4],
             -392.65,
         ),
     ]
 
-    def _test_optimal(self, i, test_case, is_float: bool = False):
+    test_cases_infinite = [
+        # Infinite Square 1 (5x5, -inf costs)
+        (
+            [
+                [18, 14, 9, 5, 17],
+                [9, float("-inf"), 17, 8, 8],
+                [7, float("-inf"), 12, 6, 10],
+                [float("-inf"), 16, 4, 12, float("-inf")],
+                [3, 3, 14, 1, 15],
+            ],
+            [2, 1, 0, 4, 3],
+            float("-inf"),
+        ),
+        # Infinite Square 2 (2x2, a column of +inf costs)
+        (
+            [
+                [float("inf"), 1],
+                [float("inf"), 9],
+            ],
+            [1, 0],
+            float("inf"),
+            {},
+            False,  # Unsolvable
+        ),
+        # Infinite Square 3 (1x1)
+        (
+            [[float("inf")]],
+            [0],
+            float("inf"),
+        ),
+    ]
+
+    def _test_optimal(
+        self, i, test_case, is_float: bool = False, method: str = "hungarian"
+    ):
 
         solvable = True
         disallowment_map = {}
@@ -526,7 +640,7 @@ class Test_OptimalMinimization(unittest.TestCase):
             )
 
         assignments, inversions, is_optimal = munkres(
-            cost_matrix, disallowment_map=disallowment_map
+            cost_matrix, disallowment_map=disallowment_map, method=method
         )
         total_cost = sum(
             cost_matrix[i][j] if j != -1 else 0 for i, j in enumerate(assignments)
@@ -584,6 +698,42 @@ class Test_OptimalMinimization(unittest.TestCase):
         for i, test_case in enumerate(self.test_cases_float_rect_disallow):
             self._test_optimal(i, test_case, is_float=True)
 
+    def test_optimal_infinite(self):
+        # Both methods must agree on infinite costs
+        for method in ("hungarian", "jv"):
+            for i, test_case in enumerate(self.test_cases_infinite):
+                self._test_optimal(i, test_case, method=method)
+
+    def test_optimal_jv_method(self):
+        # Ties may be broken differently, only the cost has to match
+        for test_case in (
+            self.test_cases_square
+            + self.test_cases_neg_square
+            + self.test_cases_rect
+            + self.test_cases_neg_rect
+        ):
+            cost_matrix, _, exp_cost = test_case
+            assignments, _, is_optimal = munkres(cost_matrix, method="jv")
+            total_cost = sum(
+                cost_matrix[i][j] if j != -1 else 0 for i, j in enumerate(assignments)
+            )
+            self.assertEqual(exp_cost, total_cost)
+            self.assertTrue(is_optimal)
+
+    def test_optimal_jv_method_float(self):
+        for test_case in (
+            self.test_cases_float_square
+            + self.test_cases_float_rect
+            + self.test_cases_float_square_neg
+        ):
+            cost_matrix, _, exp_cost = test_case
+            assignments, _, is_optimal = munkres(cost_matrix, method="jv")
+            total_cost = sum(
+                cost_matrix[i][j] if j != -1 else 0 for i, j in enumerate(assignments)
+            )
+            self.assertAlmostEqual(exp_cost, total_cost)
+            self.assertTrue(is_optimal)
+
 
 if __name__ == "__main__":
     unittest.main()